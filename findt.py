@@ -10,11 +10,22 @@ temporary files on disk. File discovery is performed fresh each run.
 import os
 import sys
 import argparse
+import bisect
+import codecs
 import time
 import shutil
 import subprocess
+import functools
+import queue
+import re
+import select
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Callable, Dict, List, NamedTuple, Tuple, Optional
 
 # Optional dependency detection
 try:
@@ -24,7 +35,7 @@ except ImportError:
     HAS_PYPERCLIP = False
 
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
     HAS_RAPIDFUZZ = True
 except ImportError:
     HAS_RAPIDFUZZ = False
@@ -50,6 +61,45 @@ IGNORE_PATTERNS = {
     '.mypy_cache', '.tox', 'dist', 'build'
 }
 
+# Directory traversal only fans out to threads when the root has more
+# subdirectories than this; small trees are faster to walk sequentially
+PARALLEL_WALK_MIN_DIRS = 4
+PARALLEL_WALK_WORKERS = min(8, os.cpu_count() or 1)
+
+# Indexing screen redraws are throttled to this interval (seconds)
+PROGRESS_REFRESH_INTERVAL = 0.1
+
+# Searches run on a worker thread once input has been idle for
+# SEARCH_DEBOUNCE seconds, so bursts of typing coalesce into one search.
+# Content matching opens files and waits for a longer pause.
+SEARCH_DEBOUNCE = 0.06
+CONTENT_SEARCH_DELAY = 0.3
+
+# How long a lone ESC byte waits for the rest of an escape sequence
+ESCAPE_SEQUENCE_TIMEOUT = 0.05
+
+# Fuzzy mode scores filenames through a bigram index instead of running
+# partial_ratio over every name once the corpus has this many files
+BIGRAM_INDEX_MIN_FILES = 50000
+
+# Previews and copied file contents are kept in small LRU caches keyed by
+# mtime; larger files bypass the content cache to keep memory to a few MB
+PREVIEW_CACHE_SIZE = 128
+CONTENT_CACHE_SIZE = 16
+CONTENT_CACHE_MAX_FILE_SIZE = 256 * 1024
+
+# Content search reads each text file's head once and keeps it lowercased in
+# an LRU bounded by entry count and total characters, so later keystrokes
+# test against memory instead of reopening every file
+CONTENT_HEAD_CHARS = 2048
+CONTENT_HEAD_CACHE_ENTRIES = 20000
+CONTENT_HEAD_CACHE_CHARS = 32 * 1024 * 1024
+
+# Cursor home + erase display, written directly instead of forking `clear`
+CLEAR_SEQ = '\x1b[H\x1b[2J'
+if os.name == 'nt':
+    os.system('')  # Enables ANSI escape processing in the Windows console
+
 class Colors:
     BLUE = '\033[94m'
     CYAN = '\033[96m'
@@ -62,10 +112,49 @@ class Colors:
     BOLD = '\033[1m'
     BG_BLUE = '\033[44m'
 
+class FileEntry(NamedTuple):
+    """A discovered file, with the display and lowercased search strings."""
+    path: str
+    name: str
+    parent: str  # Name of the containing directory
+    path_lower: str
+    name_lower: str
+    suffix: str  # Lowercased extension, e.g. '.py'
+
+def make_file_entry(path: str, name: str, parent: str) -> FileEntry:
+    """Build a FileEntry from a path, its final component and its directory name."""
+    return FileEntry(path, name, parent, path.lower(), name.lower(),
+                     os.path.splitext(name)[1].lower())
+
 def colored(text: str, color: str) -> str:
     """Apply color to text."""
     return f"{color}{text}{Colors.RESET}"
 
+ANSI_COLOR_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+def display_width(text: str) -> int:
+    """Terminal columns a line occupies, ignoring colors; wide chars count 2."""
+    text = ANSI_COLOR_RE.sub('', text)
+    return sum(2 if unicodedata.east_asian_width(c) in 'WF' else 1 for c in text)
+
+# Clipboard helpers in fallback order. Each one reads stdin until EOF before
+# taking ownership of the clipboard, so every copy needs its own process.
+CLIPBOARD_COMMANDS = {
+    "pbcopy": ['pbcopy'],                           # macOS
+    "xclip": ['xclip', '-selection', 'clipboard'],  # Linux
+    "xsel": ['xsel', '--clipboard', '--input'],     # Linux alternative
+}
+
+@functools.lru_cache(maxsize=None)
+def detect_clipboard_method() -> str:
+    """Detect best available clipboard method, searching PATH only once."""
+    if HAS_PYPERCLIP:
+        return "pyperclip"
+    for method, command in CLIPBOARD_COMMANDS.items():
+        if shutil.which(command[0]):
+            return method
+    return "print"
+
 class ClipboardManager:
     """Handle clipboard operations with fallback hierarchy."""
     
@@ -74,16 +163,7 @@ class ClipboardManager:
     
     def _detect_clipboard_method(self) -> str:
         """Detect best available clipboard method."""
-        if HAS_PYPERCLIP:
-            return "pyperclip"
-        elif shutil.which('pbcopy'):  # macOS
-            return "pbcopy"
-        elif shutil.which('xclip'):   # Linux
-            return "xclip"
-        elif shutil.which('xsel'):    # Linux alternative
-            return "xsel"
-        else:
-            return "print"
+        return detect_clipboard_method()
     
     def copy(self, text: str) -> bool:
         """Copy text to clipboard, return success status."""
@@ -91,16 +171,8 @@ class ClipboardManager:
             if self.method == "pyperclip":
                 pyperclip.copy(text)
                 return True
-            elif self.method == "pbcopy":
-                subprocess.run(['pbcopy'], input=text, text=True, check=True)
-                return True
-            elif self.method == "xclip":
-                subprocess.run(['xclip', '-selection', 'clipboard'], 
-                             input=text, text=True, check=True)
-                return True
-            elif self.method == "xsel":
-                subprocess.run(['xsel', '--clipboard', '--input'], 
-                             input=text, text=True, check=True)
+            elif self.method in CLIPBOARD_COMMANDS:
+                subprocess.run(CLIPBOARD_COMMANDS[self.method], input=text, text=True, check=True)
                 return True
             else:
                 print(f"\n📋 Clipboard content:\n{text}")
@@ -111,57 +183,42 @@ class ClipboardManager:
     
     def get_status_text(self) -> str:
         """Get clipboard status for UI display."""
-        if self.method in ["pyperclip", "pbcopy", "xclip", "xsel"]:
+        if self.method == "pyperclip" or self.method in CLIPBOARD_COMMANDS:
             return "📋 Clipboard ready"
         else:
             return "⚠️ Clipboard disabled"
 
-def get_file_icon(file_path: Path) -> str:
-    """Get emoji icon for file type."""
-    suffix = file_path.suffix.lower()
-    if file_path.is_dir():
-        return "📁"
-    elif suffix in ['.py']:
-        return "🐍"
-    elif suffix in ['.js', '.ts']:
-        return "💛"
-    elif suffix in ['.json', '.yaml', '.yml', '.toml']:
-        return "⚙️"
-    elif suffix in ['.md', '.rst']:
-        return "📝"
-    elif suffix in ['.txt', '.log']:
-        return "📄"
-    elif suffix in ['.html', '.css']:
-        return "🌐"
-    elif suffix in ['.sh', '.bash', '.zsh']:
-        return "🔧"
-    else:
-        return "📄"
+DEFAULT_FILE_ICON = "📄"
+SUFFIX_TO_ICON = {
+    '.py': "🐍",
+    '.js': "💛", '.ts': "💛",
+    '.json': "⚙️", '.yaml': "⚙️", '.yml': "⚙️", '.toml': "⚙️",
+    '.md': "📝", '.rst': "📝",
+    '.txt': "📄", '.log': "📄",
+    '.html': "🌐", '.css': "🌐",
+    '.sh': "🔧", '.bash': "🔧", '.zsh': "🔧",
+}
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Lower bounds (seconds) of each "time ago" unit, and the matching divisors
+TIME_AGO_THRESHOLDS = (60, 3600, 86400)
+TIME_AGO_UNITS = ((60, 'm'), (3600, 'h'), (86400, 'd'))
 
 def format_size(size: int) -> str:
     """Format file size in human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size < 1024.0:
-            return f"{size:.1f}{unit}"
-        size /= 1024.0
-    return f"{size:.1f}TB"
+    # Every 10 bits is one 1024x unit step
+    unit_index = min((size.bit_length() - 1) // 10, len(SIZE_UNITS) - 1) if size > 0 else 0
+    return f"{size / (1 << (10 * unit_index)):.1f}{SIZE_UNITS[unit_index]}"
 
 def format_time_ago(timestamp: float) -> str:
     """Format time ago in human readable format."""
-    now = time.time()
-    diff = now - timestamp
-    
-    if diff < 60:
+    diff = time.time() - timestamp
+    unit_index = bisect.bisect_right(TIME_AGO_THRESHOLDS, diff)
+    if unit_index == 0:
         return "now"
-    elif diff < 3600:
-        minutes = int(diff / 60)
-        return f"{minutes}m ago"
-    elif diff < 86400:
-        hours = int(diff / 3600)
-        return f"{hours}h ago"
-    else:
-        days = int(diff / 86400)
-        return f"{days}d ago"
+    divisor, unit = TIME_AGO_UNITS[unit_index - 1]
+    return f"{int(diff / divisor)}{unit} ago"
 
 def should_include_file(filename: str, include_hidden: bool = False) -> bool:
     """Check if file should be included in search."""
@@ -177,13 +234,99 @@ def should_include_dir(dirname: str, include_hidden: bool = False) -> bool:
         return False
     return True
 
-def discover_files_with_progress(directory: Path, include_hidden: bool = False) -> List[Path]:
-    """Discover searchable files with progress display."""
+def scan_directory(directory: str, include_hidden: bool = False) -> Tuple[List[str], List[FileEntry]]:
+    """List one directory, returning (subdirectories to traverse, files to include).
+
+    DirEntry carries the d_type from readdir, so classifying entries needs no
+    extra stat calls. Unreadable directories are treated as empty.
+    """
+    subdirs = []
+    files = []
+    parent = os.path.basename(directory) or directory
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    # Directory symlinks are neither listed nor followed
+                    if not is_dir and entry.is_symlink() and entry.is_dir():
+                        continue
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if should_include_dir(entry.name, include_hidden):
+                        subdirs.append(entry.path)
+                elif should_include_file(entry.name, include_hidden):
+                    files.append(make_file_entry(entry.path, entry.name, parent))
+    except OSError:
+        pass  # Skip directories we can't read
+    return subdirs, files
+
+def walk_directories_parallel(root: str, subdirs: List[str], root_files: List[FileEntry],
+                              include_hidden: bool = False,
+                              progress: Optional[Callable[[str, int], None]] = None) -> List[FileEntry]:
+    """Walk the subdirectories of an already scanned root on a thread pool.
+
+    Workers pull directories from a shared queue and push their subdirectories
+    back onto it; scandir releases the GIL, so listings overlap on cold caches.
+    Results are reassembled in the same order a sequential walk would produce.
+    """
+    work = queue.Queue()
+    results = queue.Queue()
+    stopped = threading.Event()  # Set once the main thread stops collecting
+    listings = {root: (subdirs, root_files)}
+
+    def worker():
+        while True:
+            current = work.get()
+            if current is None or stopped.is_set():
+                return
+            try:
+                found_dirs, found_files = scan_directory(current, include_hidden)
+            except Exception as e:
+                # Every queued directory must report back, or the main thread
+                # waits forever; it re-raises the error instead
+                results.put((current, None, e))
+                return
+            # Report before queueing children so the parent is always counted first
+            results.put((current, found_dirs, found_files))
+            for subdir in found_dirs:
+                work.put(subdir)
+
+    with ThreadPoolExecutor(max_workers=PARALLEL_WALK_WORKERS) as pool:
+        for _ in range(PARALLEL_WALK_WORKERS):
+            pool.submit(worker)
+        try:
+            for subdir in subdirs:
+                work.put(subdir)
+            outstanding = len(subdirs)
+            while outstanding:
+                current, found_dirs, found_files = results.get()
+                if found_dirs is None:
+                    raise found_files
+                listings[current] = (found_dirs, found_files)
+                outstanding += len(found_dirs) - 1
+                if progress:
+                    progress(current, len(found_files))
+        finally:
+            stopped.set()
+            for _ in range(PARALLEL_WALK_WORKERS):
+                work.put(None)
+
     files = []
+    stack = [root]
+    while stack:
+        found_dirs, found_files = listings.pop(stack.pop())
+        files.extend(found_files)
+        stack.extend(reversed(found_dirs))
+    return files
+
+def discover_files_with_progress(directory: Path, include_hidden: bool = False) -> List[FileEntry]:
+    """Discover searchable files with progress display."""
     
     def show_indexing_screen(file_count: int, current_dir: str = ""):
         """Display beautiful indexing progress screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
         
         # Progress bar (simple animation)
         progress_chars = "⣾⣽⣻⢿⡿⣟⣯⣷"
@@ -214,72 +357,168 @@ def discover_files_with_progress(directory: Path, include_hidden: bool = False)
         screen += """║                                                         ║
 ╚═════════════════════════════════════════════════════════╝"""
         
-        print(colored(screen, Colors.BLUE))
-    
-    try:
-        file_count = 0
-        for root, dirs, filenames in os.walk(directory):
-            # Show progress every 50 files or on directory change
-            if file_count % 50 == 0:
-                show_indexing_screen(file_count, str(Path(root).name))
-            
-            # Filter directories in-place
-            dirs[:] = [d for d in dirs if should_include_dir(d, include_hidden)]
-            
-            # Add files
-            for filename in filenames:
-                if should_include_file(filename, include_hidden):
-                    files.append(Path(root) / filename)
-                    file_count += 1
-                    
-                    # Update progress frequently for slow directories
-                    if file_count % 50 == 0:
-                        show_indexing_screen(file_count, str(Path(root).name))
-    
-    except PermissionError:
-        pass  # Skip directories we can't read
+        sys.stdout.write(CLEAR_SEQ + colored(screen, Colors.BLUE) + '\n')
+        sys.stdout.flush()
     
+    root = str(directory)
+    file_count = 0
+    last_draw = time.monotonic()
+
+    def report(current: str, found: int):
+        """Count newly found files, refreshing the screen at most every 100ms."""
+        nonlocal file_count, last_draw
+        file_count += found
+        now = time.monotonic()
+        if now - last_draw > PROGRESS_REFRESH_INTERVAL:
+            last_draw = now
+            show_indexing_screen(file_count, os.path.basename(current))
+
+    show_indexing_screen(0, os.path.basename(root))
+    subdirs, root_files = scan_directory(root, include_hidden)
+    report(root, len(root_files))
+
+    if len(subdirs) > PARALLEL_WALK_MIN_DIRS and PARALLEL_WALK_WORKERS > 1:
+        files = walk_directories_parallel(root, subdirs, root_files, include_hidden, report)
+    else:
+        # Stack-based walk; push in reverse so directories are visited in
+        # listing order, like os.walk
+        files = root_files
+        stack = list(reversed(subdirs))
+        while stack:
+            current = stack.pop()
+            subdirs, found = scan_directory(current, include_hidden)
+            files.extend(found)
+            report(current, len(found))
+            stack.extend(reversed(subdirs))
+
     # Final progress update
     show_indexing_screen(len(files), "Complete!")
     time.sleep(0.3)  # Brief pause to show completion
-    
+
     return files
 
 
-def discover_files(directory: Path, include_hidden: bool = False) -> List[Path]:
+def discover_files(directory: Path, include_hidden: bool = False) -> List[FileEntry]:
     """Legacy function for compatibility - now uses progress version."""
     return discover_files_with_progress(directory, include_hidden)
 
-def exact_search(query: str, files: List[Path]) -> List[Tuple[Path, str]]:
-    """Fast exact substring matching."""
-    if not query:
-        return [(f, "all") for f in files]
+def search_filenames(query: str, files: List[FileEntry]) -> List[Tuple[FileEntry, str]]:
+    """Exact substring matching against filenames only; touches no files."""
+    query_lower = query.lower()
+    return [(entry, "filename") for entry in files if query_lower in entry.name_lower]
+
+class ContentHeadCache:
+    """LRU cache of the lowercased head of text files for content search.
+    
+    Each entry is (text, exact_end): the first 2048 characters lowercased,
+    and where the first 1024 of them end in that text. Exact search only
+    looks at the first 1KB, fuzzy scoring at all of it.
+    """
     
+    def __init__(self, max_entries: int = CONTENT_HEAD_CACHE_ENTRIES,
+                 max_chars: int = CONTENT_HEAD_CACHE_CHARS):
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.entries = OrderedDict()  # path -> (text, exact_end)
+        self.chars = 0
+    
+    def get(self, path: str) -> Tuple[str, int]:
+        """Head of the file at path, read on first use; ('', 0) if unreadable."""
+        head = self.entries.get(path)
+        if head is not None:
+            self.entries.move_to_end(path)
+            return head
+        
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                text = f.read(CONTENT_HEAD_CHARS)
+        except (IOError, UnicodeDecodeError, PermissionError):
+            text = ''
+        head = (text.lower(), len(text[:1024].lower()))
+        
+        self.entries[path] = head
+        self.chars += len(head[0])
+        while len(self.entries) > self.max_entries or self.chars > self.max_chars:
+            _, (evicted, _) = self.entries.popitem(last=False)
+            self.chars -= len(evicted)
+        return head
+
+def search_content(query: str, files: List[FileEntry],
+                   head_cache: Optional[ContentHeadCache] = None) -> List[Tuple[FileEntry, str]]:
+    """Exact substring matching against the start of text files."""
     results = []
     query_lower = query.lower()
+    head_cache = head_cache or ContentHeadCache()
     
-    for file_path in files:
-        # Search in filename
-        if query_lower in file_path.name.lower():
-            results.append((file_path, "filename"))
-            continue
-            
-        # Search in file content (text files only)
-        if file_path.suffix.lower() in TEXT_EXTENSIONS:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read(1024)  # First 1KB only for speed
-                    if query_lower in content.lower():
-                        results.append((file_path, "content"))
-            except (IOError, UnicodeDecodeError, PermissionError):
-                pass
+    for entry in files:
+        if entry.suffix in TEXT_EXTENSIONS:
+            content, exact_end = head_cache.get(entry.path)  # First 1KB only for speed
+            if content.find(query_lower, 0, exact_end) != -1:
+                results.append((entry, "content"))
     
     return results
 
-def fuzzy_search(query: str, files: List[Path]) -> List[Tuple[Path, str]]:
-    """Enhanced fuzzy matching with rapidfuzz, content search, and proper scoring."""
+def exact_search(query: str, files: List[FileEntry], include_content: bool = True,
+                 head_cache: Optional[ContentHeadCache] = None) -> List[Tuple[FileEntry, str]]:
+    """Fast exact substring matching, filename matches first."""
+    if not query:
+        return [(f, "all") for f in files]
+    
+    results = search_filenames(query, files)
+    
+    # Search in file content for everything the filename didn't match
+    if include_content:
+        query_lower = query.lower()
+        unmatched = [entry for entry in files if query_lower not in entry.name_lower]
+        results.extend(search_content(query, unmatched, head_cache))
+    
+    return results
+
+class BigramIndex:
+    """Inverted index from character bigrams to the filenames containing them.
+    
+    Scoring a query only visits the posting lists of its own bigrams, so the
+    cost per keystroke depends on how common those bigrams are rather than on
+    the size of the corpus.
+    """
+    
+    def __init__(self, names: List[str]):
+        self.names = names
+        self.postings: Dict[str, List[int]] = {}
+        for index, name in enumerate(names):
+            for bigram in {name[i:i + 2] for i in range(len(name) - 1)}:
+                self.postings.setdefault(bigram, []).append(index)
+    
+    def score(self, query: str, score_cutoff: float = 0) -> Dict[int, float]:
+        """Score names 0-100 by the share of the query's bigrams they contain.
+        
+        Names that contain the query as a substring score 100, like
+        partial_ratio; names with every bigram but not the whole query are
+        capped just below that.
+        """
+        bigrams = {query[i:i + 2] for i in range(len(query) - 1)}
+        if not bigrams:
+            return {i: 100 for i, name in enumerate(self.names) if query in name}
+        
+        counts = Counter(chain.from_iterable(self.postings.get(b, ()) for b in bigrams))
+        scores = {}
+        for index, count in counts.items():
+            score = 100 * count / len(bigrams)
+            if score == 100 and query not in self.names[index]:
+                score = 90
+            if score >= score_cutoff:
+                scores[index] = score
+        return scores
+
+def fuzzy_search(query: str, files: List[FileEntry], include_content: bool = True,
+                 name_index: Optional[BigramIndex] = None,
+                 head_cache: Optional[ContentHeadCache] = None) -> List[Tuple[FileEntry, str]]:
+    """Enhanced fuzzy matching with rapidfuzz, content search, and proper scoring.
+    
+    name_index, if given, must be built over the names of files in order.
+    """
     if not HAS_RAPIDFUZZ:
-        return exact_search(query, files)
+        return exact_search(query, files, include_content, head_cache)
     
     if not query:
         return [(f, "all") for f in files]
@@ -287,51 +526,58 @@ def fuzzy_search(query: str, files: List[Path]) -> List[Tuple[Path, str]]:
     results = []
     query_lower = query.lower()
     
-    for file_path in files:
-        best_score = 0
-        best_match_type = "filename"
-        
-        # Fuzzy match filename (highest priority)
-        filename_score = fuzz.partial_ratio(query_lower, file_path.name.lower())
-        if filename_score > best_score:
-            best_score = filename_score
-            best_match_type = "filename"
-        
-        # Fuzzy match full path (medium priority)
-        path_score = fuzz.partial_ratio(query_lower, str(file_path).lower())
-        if path_score > best_score:
-            best_score = path_score
-            best_match_type = "path"
-        
-        # Fuzzy match file content (lower priority, but still valuable)
-        if file_path.suffix.lower() in TEXT_EXTENSIONS:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read(2048).lower()  # Read more content for better fuzzy matching
-                    content_score = fuzz.partial_ratio(query_lower, content)
-                    # Weight content matches slightly lower than filename matches
-                    weighted_content_score = content_score * 0.8
-                    if weighted_content_score > best_score:
-                        best_score = weighted_content_score
-                        best_match_type = "content"
-            except (IOError, UnicodeDecodeError, PermissionError):
-                pass
+    # Filenames, paths and contents are scored in one batched call each, so
+    # rapidfuzz preprocesses the query once and runs the scorer loop in C++
+    # instead of once per file from Python
+    best = {}  # file index -> (score, match_type)
+    
+    # Fuzzy match filename (highest priority)
+    if name_index is not None:
+        for index, score in name_index.score(query_lower, score_cutoff=50).items():
+            best[index] = (score, "filename")
+    else:
+        names = [entry.name_lower for entry in files]
+        for _, score, index in process.extract(query_lower, names, scorer=fuzz.partial_ratio,
+                                               processor=None, score_cutoff=50, limit=None):
+            best[index] = (score, "filename")
+    
+    # Fuzzy match full path (medium priority)
+    paths = [entry.path_lower for entry in files]
+    for _, score, index in process.extract(query_lower, paths, scorer=fuzz.partial_ratio,
+                                           processor=None, score_cutoff=50, limit=None):
+        if score > best.get(index, (0, None))[0]:
+            best[index] = (score, "path")
+    
+    # Fuzzy match file content (lower priority, but still valuable)
+    if include_content:
+        head_cache = head_cache or ContentHeadCache()
+        contents = {index: head_cache.get(entry.path)[0]  # Up to 2KB for better fuzzy matching
+                    for index, entry in enumerate(files) if entry.suffix in TEXT_EXTENSIONS}
+        # Weight content matches slightly lower than filename matches; below
+        # 62.5 the weighted score can't clear the threshold of 50 anyway
+        for _, score, index in process.extract(query_lower, contents, scorer=fuzz.partial_ratio,
+                                               processor=None, score_cutoff=62.5, limit=None):
+            if score * 0.8 > best.get(index, (0, None))[0]:
+                best[index] = (score * 0.8, "content")
+    
+    for index, entry in enumerate(files):
+        best_score, best_match_type = best.get(index, (0, "filename"))
         
         # Include results with score above threshold
         if best_score > 50:  # Lowered threshold for more inclusive fuzzy matching
-            results.append((file_path, best_match_type, best_score))
+            results.append((entry, best_match_type, best_score))
     
     # Sort by score (highest first), then by match type priority, then by filename
     def sort_key(item):
-        path, match_type, score = item
+        entry, match_type, score = item
         # Priority: filename > path > content
         type_priority = {"filename": 3, "path": 2, "content": 1}
-        return (-score, -type_priority.get(match_type, 0), path.name.lower())
+        return (-score, -type_priority.get(match_type, 0), entry.name_lower)
     
     results.sort(key=sort_key)
     
     # Return in the expected format (without scores)
-    return [(path, match_type) for path, match_type, score in results]
+    return [(entry, match_type) for entry, match_type, score in results]
 
 def get_file_preview(file_path: Path, lines: int = 4) -> str:
     """Get first few lines of file for preview."""
@@ -339,7 +585,16 @@ def get_file_preview(file_path: Path, lines: int = 4) -> str:
         return f"Binary file ({file_path.suffix})"
     
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        stat = os.stat(file_path)
+    except OSError:
+        return "Unable to preview file"
+    return _read_preview(str(file_path), stat.st_mtime_ns, lines)
+
+@functools.lru_cache(maxsize=PREVIEW_CACHE_SIZE)
+def _read_preview(path: str, mtime_ns: int, lines: int) -> str:
+    """Read preview lines; mtime_ns only keys the cache so edits are picked up."""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
             preview_lines = []
             for _ in range(lines):
                 line = f.readline()
@@ -356,11 +611,53 @@ def get_file_content(file_path: Path) -> str:
         return f"Cannot copy binary file: {file_path}"
     
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        stat = os.stat(file_path)
+    except OSError as e:
+        return f"Error reading file: {e}"
+    if stat.st_size > CONTENT_CACHE_MAX_FILE_SIZE:
+        return _read_content.__wrapped__(str(file_path), stat.st_mtime_ns)
+    return _read_content(str(file_path), stat.st_mtime_ns)
+
+@functools.lru_cache(maxsize=CONTENT_CACHE_SIZE)
+def _read_content(path: str, mtime_ns: int) -> str:
+    """Read a whole file; mtime_ns only keys the cache so edits are picked up."""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
             return f.read()
     except (IOError, UnicodeDecodeError, PermissionError) as e:
         return f"Error reading file: {e}"
 
+def split_keys(data: str) -> List[str]:
+    """Split raw terminal input into keys, keeping escape sequences whole."""
+    keys = []
+    i = 0
+    while i < len(data):
+        if data[i] == '\x1b' and data[i + 1:i + 2] == '[':
+            # CSI sequence: parameters, then one final byte in '@'..'~'
+            end = i + 2
+            while end < len(data) and not '@' <= data[end] <= '~':
+                end += 1
+            keys.append(data[i:end + 1])
+            i = end + 1
+        elif data[i] == '\x1b' and data[i + 1:i + 2] == 'O':
+            keys.append(data[i:i + 3])  # SS3 sequence, e.g. arrows in keypad mode
+            i += 3
+        elif data[i] == '\x1b' and data[i + 1:i + 2] not in ('', '\x1b'):
+            keys.append(data[i:i + 2])  # Alt/Meta + key, which nothing binds
+            i += 2
+        else:
+            keys.append(data[i])
+            i += 1
+    return keys
+
+def ends_in_partial_escape(data: bytes) -> bool:
+    """Check if data ends in an escape sequence that may still be arriving."""
+    tail = data[data.rfind(b'\x1b'):] if b'\x1b' in data else b''
+    if tail in (b'\x1b', b'\x1bO'):
+        return True
+    # CSI is complete once a final byte in '@'..'~' follows the parameters
+    return tail.startswith(b'\x1b[') and not any(0x40 <= b <= 0x7e for b in tail[2:])
+
 class SearchMode:
     """Manage search mode state."""
     
@@ -389,95 +686,235 @@ class FuzzyFinder:
         self.selected_index = 0
         self.selected_file = None  # File that shows preview
         self.scroll_offset = 0
+        # (query_lower, filename matches) for successive prefixes of the query
+        self.result_stack = []
+        self._name_index = None  # BigramIndex for fuzzy mode on large corpora
+        self._content_cache = ContentHeadCache()  # Only touched under _search_lock
+        
+        # Background search state; every query change bumps the epoch and
+        # workers drop results that belong to an older one
+        self._search_epoch = 0
+        self._search_thread = None
+        self._search_lock = threading.Lock()  # Serializes result_stack access
+        self._search_active = False
+        self._results_ready = threading.Event()
+        self._published = None  # (epoch, results, final)
+        # Guards the epoch and _published together, so a superseded worker
+        # can't overwrite the newer query's results after checking its epoch
+        self._publish_lock = threading.Lock()
+        # Workers write a byte here after publishing, so waiting for input can
+        # select on stdin and this pipe instead of polling
+        self._wake_r, self._wake_w = os.pipe() if HAS_TERMIOS else (None, None)
+        
+        # What the main loop still owes: a search for the query, and a redraw
+        self._query_dirty = False
+        self._display_dirty = True
+        
+        # Last frame drawn, one string per terminal row, for differential redraws
+        self._prev_lines = []
+        self._terminal_size = None
+        # Keeps a multi-byte character split across reads until it completes
+        self._input_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._stat_cache = {}  # path -> (formatted size, mtime), or None if unreadable
+        self._display_cache = {}  # path -> (name cell, age text, info line)
         self.mode = SearchMode()
         self.clipboard = ClipboardManager()
+        self._key_handlers = self.build_key_handlers()
         
         # Discover files
         self.all_files = discover_files(self.directory, self.mode.show_hidden)
         self.filtered_files = self.search()
+        if self.query:
+            self.request_search()  # Adds content matches once idle
         
         # Fix initial selection if no files found
         if not self.filtered_files:
             self.selected_index = -1
     
-    def search(self) -> List[Tuple[Path, str]]:
-        """Perform search based on current mode and query."""
+    def search(self, include_content: bool = False,
+               query: Optional[str] = None) -> List[Tuple[FileEntry, str]]:
+        """Perform search based on current mode and query.
+        
+        Content matching opens files, so it is left out unless requested.
+        """
+        query = self.query if query is None else query
         if self.mode.fancy_mode:
-            return fuzzy_search(self.query, self.all_files)
+            return fuzzy_search(query, self.all_files, include_content,
+                                self.get_name_index(), self._content_cache)
+        
+        if not query:
+            self.result_stack.clear()
+            return [(f, "all") for f in self.all_files]
+        
+        results = self.search_filenames(query)
+        if include_content:
+            query_lower = query.lower()
+            unmatched = [entry for entry in self.all_files if query_lower not in entry.name_lower]
+            results = results + search_content(query, unmatched, self._content_cache)
+        return results
+    
+    def get_name_index(self) -> Optional[BigramIndex]:
+        """Bigram index over all filenames, built on first use for large corpora."""
+        if self._name_index is None and len(self.all_files) >= BIGRAM_INDEX_MIN_FILES:
+            self._name_index = BigramIndex([entry.name_lower for entry in self.all_files])
+        return self._name_index
+    
+    def request_search(self):
+        """Re-run the search for the current query on a worker thread."""
+        with self._publish_lock:
+            self._search_epoch += 1
+            self._search_active = True
+            epoch = self._search_epoch
+        self._search_thread = threading.Thread(
+            target=self._search_worker, args=(epoch, self.query), daemon=True)
+        self._search_thread.start()
+    
+    def _search_worker(self, epoch: int, query: str):
+        """Debounced two-phase search: filenames first, then file contents."""
+        time.sleep(SEARCH_DEBOUNCE)
+        if epoch != self._search_epoch:
+            return  # Superseded by a newer keystroke
+        with self._search_lock:
+            results = self.search(query=query)
+        if not query:
+            self._publish(epoch, results, final=True)
+            return
+        
+        self._publish(epoch, results, final=False)
+        time.sleep(CONTENT_SEARCH_DELAY - SEARCH_DEBOUNCE)
+        if epoch != self._search_epoch:
+            return
+        with self._search_lock:
+            results = self.search(include_content=True, query=query)
+        self._publish(epoch, results, final=True)
+    
+    def _publish(self, epoch: int, results: List[Tuple[FileEntry, str]], final: bool):
+        """Hand results to the main loop if they are still for the latest query."""
+        with self._publish_lock:
+            if epoch != self._search_epoch:
+                return
+            self._published = (epoch, results, final)
+            self._results_ready.set()
+        if self._wake_w is not None:
+            os.write(self._wake_w, b'\0')
+    
+    def apply_search_results(self) -> bool:
+        """Swap in published search results. Return True if the view changed."""
+        if not self._results_ready.is_set():
+            return False
+        with self._publish_lock:
+            self._results_ready.clear()
+            epoch, results, final = self._published
+            if epoch != self._search_epoch:
+                return False
+            if final:
+                self._search_active = False
+        
+        self.filtered_files = results
+        self._display_dirty = True
+        # Fix index after search
+        if self.filtered_files:
+            self.selected_index = min(max(self.selected_index, 0), len(self.filtered_files) - 1)
         else:
-            return exact_search(self.query, self.all_files)
+            self.selected_index = -1
+        return True
     
-    def clear_screen(self):
-        """Clear terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+    def wait_for_input(self) -> Optional[str]:
+        """Wait for input while background search is running.
+        
+        Returns None when new search results arrived and the UI needs redrawing.
+        """
+        while self._search_active:
+            if not HAS_TERMIOS:
+                # Line input can't be polled, so wait for the search to finish
+                self._search_thread.join()
+            else:
+                keys = self.get_input(wake_fd=self._wake_r)
+                if keys is not None:
+                    return keys
+            if self.apply_search_results():
+                return None
+        return self.get_input()
     
-    def get_display_range(self, terminal_height: int = 20) -> Tuple[int, int]:
-        """Get the range of files to display based on scroll offset."""
-        # Reserve space for header (3 lines) and footer (1 line) and preview
-        available_height = terminal_height - 6
+    def search_filenames(self, query: str) -> List[Tuple[FileEntry, str]]:
+        """Exact filename matches, narrowed from the longest cached prefix query.
+        
+        Any file whose name contains the query also contains every prefix of
+        it, so typing only needs to re-check the previous results, and
+        backspacing back to a cached query needs no search at all.
+        """
+        query_lower = query.lower()
+        stack = self.result_stack
+        while stack and not query_lower.startswith(stack[-1][0]):
+            stack.pop()
+        if stack and stack[-1][0] == query_lower:
+            return stack[-1][1]
+        
+        candidates = [entry for entry, _ in stack[-1][1]] if stack else self.all_files
+        results = search_filenames(query, candidates)
+        stack.append((query_lower, results))
+        return results
+    
+    def get_visible_count(self) -> int:
+        """How many files fit on screen between the header and the footer."""
+        # Reserve the header and footer (3 lines each) and the row the cursor
+        # is parked on, so the frame never scrolls the terminal
+        available_height = shutil.get_terminal_size().lines - 7
         if self.mode.show_preview and self.selected_file:
             available_height -= 6  # Space for preview box
-        
+        return max(1, available_height // 3)  # Each file takes 3 lines
+    
+    def get_display_range(self) -> Tuple[int, int]:
+        """Get the range of files to display based on scroll offset."""
         start = self.scroll_offset
-        end = min(start + available_height, len(self.filtered_files))
+        end = min(start + self.get_visible_count(), len(self.filtered_files))
         return start, end
     
     def draw_ui(self):
-        """Draw the main user interface."""
-        self.clear_screen()
+        """Draw the main user interface, rewriting only lines that changed."""
+        lines = []
         
         # Header
-        print(colored("╔═ findt - Beautiful Fuzzy Finder ═══════════════════════╗", Colors.BLUE))
+        lines.append(colored("╔═ findt - Beautiful Fuzzy Finder ═══════════════════════╗", Colors.BLUE))
         search_display = f"🔍 Search: {self.query}"
         padding = 55 - len(search_display)
-        print(colored(f"║ {search_display}{' ' * padding} ║", Colors.BLUE))
-        print(colored("╠═════════════════════════════════════════════════════════╣", Colors.BLUE))
+        lines.append(colored(f"║ {search_display}{' ' * padding} ║", Colors.BLUE))
+        lines.append(colored("╠═════════════════════════════════════════════════════════╣", Colors.BLUE))
         
         # File list
-        terminal_height = 20  # Could be detected with shutil.get_terminal_size()
-        start, end = self.get_display_range(terminal_height)
+        start, end = self.get_display_range()
         
         for i in range(start, end):
-            file_path, match_type = self.filtered_files[i]
-            icon = get_file_icon(file_path)
+            entry, match_type = self.filtered_files[i]
             
             # Format entry
             is_current = (i == self.selected_index)
-            is_selected = (self.selected_file == file_path)
-            
-            # File info
-            try:
-                stat = file_path.stat()
-                size = format_size(stat.st_size)
-                modified = format_time_ago(stat.st_mtime)
-                rel_path = file_path.parent.name if file_path.parent.name != '.' else '.'
-            except (OSError, PermissionError):
-                size, modified, rel_path = "?", "?", "?"
+            is_selected = (self.selected_file == entry)
+            name_cell, info_line = self.get_display_strings(entry)
             
             # Build display line
             cursor = "→" if is_current else " "
             selected_mark = "●" if is_selected else " "
             
-            name_line = f"║ {cursor}[{i+1}] {icon} {file_path.name:<35} {selected_mark} ║"
-            info_line = f"║    {rel_path} • {size} • {modified}{' ' * (55 - len(f'{rel_path} • {size} • {modified}'))} ║"
+            name_line = f"║ {cursor}[{i+1}] {name_cell} {selected_mark} ║"
             
             if is_current:
-                print(colored(name_line, Colors.CYAN))
-                print(colored(info_line, Colors.GRAY))
+                lines.append(colored(name_line, Colors.CYAN))
+                lines.append(colored(info_line, Colors.GRAY))
             else:
-                print(name_line)
-                print(colored(info_line, Colors.GRAY))
+                lines.append(name_line)
+                lines.append(colored(info_line, Colors.GRAY))
             
             # Show preview for selected file right after its entry
             if is_selected and self.mode.show_preview:
-                preview = get_file_preview(file_path)
-                print(colored("║     ┌─ Preview ──────────────────────────────────────┐     ║", Colors.GRAY))
+                preview = get_file_preview(Path(entry.path))
+                lines.append(colored("║     ┌─ Preview ──────────────────────────────────────┐     ║", Colors.GRAY))
                 for line in preview.split('\n'):
                     preview_line = f"     │ {line:<50} │"
-                    print(colored(f"║{preview_line[:57]}{' ' * max(0, 57 - len(preview_line))} ║", Colors.GRAY))
-                print(colored("║     └─────────────────────────────────────────────────┘     ║", Colors.GRAY))
+                    lines.append(colored(f"║{preview_line[:57]}{' ' * max(0, 57 - len(preview_line))} ║", Colors.GRAY))
+                lines.append(colored("║     └─────────────────────────────────────────────────┘     ║", Colors.GRAY))
             
-            print(colored("║" + " " * 57 + "║", Colors.BLUE))
+            lines.append(colored("║" + " " * 57 + "║", Colors.BLUE))
         
         # Fill remaining space if needed
         displayed_lines = (end - start) * 3  # Each file takes 3 lines
@@ -486,7 +923,7 @@ class FuzzyFinder:
         
         remaining_lines = max(0, 10 - displayed_lines)
         for _ in range(remaining_lines):
-            print(colored("║" + " " * 57 + "║", Colors.BLUE))
+            lines.append(colored("║" + " " * 57 + "║", Colors.BLUE))
         
         # Footer
         mode_text = self.mode.get_mode_text()
@@ -494,13 +931,100 @@ class FuzzyFinder:
         file_count = len(self.filtered_files)
         status = f"{mode_text} • {clipboard_text} • {file_count} files • ?:help"
         status_padding = 55 - len(status)
-        print(colored("╠═════════════════════════════════════════════════════════╣", Colors.BLUE))
-        print(colored(f"║ {status}{' ' * status_padding} ║", Colors.BLUE))
-        print(colored("╚═════════════════════════════════════════════════════════╝", Colors.BLUE))
+        lines.append(colored("╠═════════════════════════════════════════════════════════╣", Colors.BLUE))
+        lines.append(colored(f"║ {status}{' ' * status_padding} ║", Colors.BLUE))
+        lines.append(colored("╚═════════════════════════════════════════════════════════╝", Colors.BLUE))
+        
+        if not self.filtered_files:
+            lines.append("")
+            lines.append(colored("🔍 No files found. Try a different search term.", Colors.YELLOW))
+        
+        self.render_lines(lines)
+    
+    def get_file_info(self, entry: FileEntry) -> Optional[Tuple[str, float]]:
+        """Get (formatted size, mtime) for a file, stat'ing it only once per session."""
+        try:
+            return self._stat_cache[entry.path]
+        except KeyError:
+            pass
+        try:
+            stat = os.stat(entry.path)
+            info = (format_size(stat.st_size), stat.st_mtime)
+        except OSError:
+            info = None
+        self._stat_cache[entry.path] = info
+        return info
+    
+    def get_display_strings(self, entry: FileEntry) -> Tuple[str, str]:
+        """Get the padded icon + name cell and the info line for a file.
+        
+        Both are formatted once per file; the info line is only rebuilt when
+        its "time ago" text moves on.
+        """
+        info = self.get_file_info(entry)
+        if info:
+            size, mtime = info
+            modified = format_time_ago(mtime)
+        else:
+            size, modified = "?", "?"
+        
+        cached = self._display_cache.get(entry.path)
+        if cached is not None and cached[1] == modified:
+            return cached[0], cached[2]
+        
+        if cached is not None:
+            name_cell = cached[0]
+        else:
+            # Discovery only yields files, so the suffix alone picks the icon
+            icon = SUFFIX_TO_ICON.get(entry.suffix, DEFAULT_FILE_ICON)
+            name_cell = f"{icon} {entry.name:<35}"
+        rel_path = entry.parent if info else "?"
+        details = f"{rel_path} • {size} • {modified}"
+        info_line = f"║    {details}{' ' * (55 - len(details))} ║"
+        self._display_cache[entry.path] = (name_cell, modified, info_line)
+        return name_cell, info_line
+    
+    def invalidate_screen(self):
+        """Forget the last frame so the next draw repaints everything."""
+        self._prev_lines = []
+        self._display_dirty = True
+    
+    def render_lines(self, lines: List[str]):
+        """Write a frame, skipping lines identical to the previous frame.
+        
+        The whole update is assembled first and sent with a single write.
+        """
+        terminal_size = shutil.get_terminal_size()
+        if terminal_size != self._terminal_size:
+            self._terminal_size = terminal_size
+            self.invalidate_screen()
+        
+        previous = self._prev_lines
+        changed = [i for i, line in enumerate(lines) if i >= len(previous) or previous[i] != line]
+        # Unchanged lines were measured when they were first written
+        if (len(lines) >= terminal_size.lines or
+                any(display_width(lines[i]) > terminal_size.columns for i in changed)):
+            # Absolute row addressing breaks once the frame scrolls or a line
+            # wraps onto the next row, so repaint
+            sys.stdout.write(CLEAR_SEQ + '\n'.join(lines) + '\n')
+            sys.stdout.flush()
+            self._prev_lines = []
+            return
+        
+        buf = [] if previous else [CLEAR_SEQ]
+        for i in changed:
+            # Move to the start of row i+1, erase it, then write the new text
+            buf.append(f"\x1b[{i + 1};1H\x1b[2K{lines[i]}")
+        # Erase leftovers from a longer previous frame and park the cursor below
+        buf.append(f"\x1b[{len(lines) + 1};1H")
+        if len(lines) < len(previous):
+            buf.append("\x1b[J")
+        sys.stdout.write(''.join(buf))
+        sys.stdout.flush()
+        self._prev_lines = lines
     
     def show_help(self):
         """Display help overlay."""
-        self.clear_screen()
         help_text = """
 ╔══════════════════════════════════════════════════════╗
 ║                    findt - Help                      ║
@@ -532,164 +1056,231 @@ class FuzzyFinder:
 
 Press any key to continue...
 """
-        print(colored(help_text, Colors.BLUE))
-        if HAS_TERMIOS:
-            try:
-                old_settings = termios.tcgetattr(sys.stdin)
-                tty.setraw(sys.stdin.fileno())
-                sys.stdin.read(1)
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-            except:
-                input()
-        else:
-            input()
+        sys.stdout.write(CLEAR_SEQ + colored(help_text, Colors.BLUE) + '\n')
+        sys.stdout.flush()
+        # Same raw read as the main loop, so a multi-byte key is consumed whole
+        self.get_input()
     
-    def get_input(self) -> str:
-        """Get single character input, handling escape sequences."""
+    def get_input(self, wake_fd: Optional[int] = None) -> Optional[str]:
+        """Get pending keyboard input, handling escape sequences.
+        
+        Blocks for the first byte, then drains everything else already
+        waiting, so a paste or a held key arrives as one string for
+        split_keys(). Returns None if wake_fd becomes readable first.
+        """
         if not HAS_TERMIOS:
             return input()
         
         try:
-            old_settings = termios.tcgetattr(sys.stdin)
-            tty.setraw(sys.stdin.fileno())
-            char = sys.stdin.read(1)
-            
-            # Handle escape sequences (arrow keys, etc.)
-            if char == '\x1b':
-                # Read the rest of the escape sequence
-                char += sys.stdin.read(2)
-            
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-            return char
+            fd = sys.stdin.fileno()
+            old_settings = termios.tcgetattr(fd)
+            tty.setraw(fd)
+            try:
+                if wake_fd is not None:
+                    ready = select.select([fd, wake_fd], [], [])[0]
+                    if fd not in ready:
+                        os.read(wake_fd, 1024)  # Clear the wakeups
+                        return None
+                data = os.read(fd, 1024)
+                
+                # Drain the rest; give an unfinished escape sequence a moment to complete
+                while True:
+                    wait = ESCAPE_SEQUENCE_TIMEOUT if ends_in_partial_escape(data) else 0
+                    if not select.select([fd], [], [], wait)[0]:
+                        break
+                    chunk = os.read(fd, 1024)
+                    if not chunk:
+                        break
+                    data += chunk
+            finally:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+            return self._input_decoder.decode(data)
         except:
             return input()
     
-    def handle_navigation(self, key: str) -> bool:
-        """Handle navigation keys. Return True if handled."""
+    def build_key_handlers(self) -> Dict[str, Callable[[], bool]]:
+        """Map each bound key to its handler; handlers return False to quit."""
+        return {
+            # Navigation
+            '\x0a': self.move_down,      # Ctrl+J
+            '\x1b[B': self.move_down,    # Down arrow
+            '\x0b': self.move_up,        # Ctrl+K
+            '\x1b[A': self.move_up,      # Up arrow
+            '\x07': self.jump_to_top,    # Ctrl+G
+            '\x05': self.jump_to_bottom, # Ctrl+E for "End"
+            '\x1b[5~': self.page_up,
+            '\x1b[6~': self.page_down,
+            # Actions
+            '\r': self.select_current,   # Enter
+            '\x03': self.copy_path,      # Ctrl+C
+            '\x19': self.copy_content,   # Ctrl+Y
+            '\x06': self.toggle_fancy,   # Ctrl+F
+            '\x10': self.toggle_preview, # Ctrl+P
+            '\x08': self.open_help,      # Ctrl+H
+            '\x11': self.quit,           # Ctrl+Q
+            '\x1b': self.escape,
+            '\x15': self.clear_query,    # Ctrl+U
+            '\x7f': self.backspace,
+        }
+    
+    def handle_key(self, key: str) -> bool:
+        """Dispatch one key. Return True if should continue running."""
+        handler = self._key_handlers.get(key)
+        if handler is not None:
+            return handler()
+        if key.isprintable() and len(key) == 1:  # Regular character
+            self.set_query(self.query + key)
+            self.selected_index = 0
+        return True
+    
+    def move_to(self, index: int) -> bool:
+        """Move the cursor, flagging a redraw if it actually moved."""
         # Don't navigate if no files available
-        if not self.filtered_files:
-            return True if key in ['\x0a', '\x0b', '\x07', '\x05', '\x1b[A]', '\x1b[B]', '\x1b[5~', '\x1b[6~'] else False
+        if self.filtered_files and index != self.selected_index:
+            self.selected_index = index
+            self._display_dirty = True
+        return True
     
-        if key in ['\x0a', '\x1b[B']:  # Down (Ctrl+J or down arrow)
-            if self.selected_index < len(self.filtered_files) - 1:
-                self.selected_index += 1
-            return True
-        elif key in ['\x0b', '\x1b[A']:  # Up (Ctrl+K or up arrow)
-            if self.selected_index > 0:
-                self.selected_index -= 1
-            return True
-        elif key == '\x07':  # Top (Ctrl+G)
+    def move_down(self) -> bool:
+        return self.move_to(min(self.selected_index + 1, len(self.filtered_files) - 1))
+    
+    def move_up(self) -> bool:
+        return self.move_to(max(self.selected_index - 1, 0))
+    
+    def jump_to_top(self) -> bool:
+        return self.move_to(0)
+    
+    def jump_to_bottom(self) -> bool:
+        return self.move_to(len(self.filtered_files) - 1)
+    
+    def page_up(self) -> bool:
+        return self.move_to(max(0, self.selected_index - 10))
+    
+    def page_down(self) -> bool:
+        return self.move_to(min(len(self.filtered_files) - 1, self.selected_index + 10))
+    
+    def current_entry(self) -> Optional[FileEntry]:
+        """The file under the cursor, if any."""
+        if self.filtered_files and 0 <= self.selected_index < len(self.filtered_files):
+            return self.filtered_files[self.selected_index][0]
+        return None
+    
+    def select_current(self) -> bool:
+        """Select file & show preview."""
+        entry = self.current_entry()
+        if entry is not None:
+            self.selected_file = entry
+            self._display_dirty = True
+        return True
+    
+    def copy_path(self) -> bool:
+        """Copy the current file's path to the clipboard."""
+        entry = self.current_entry()
+        if entry is not None:
+            success = self.clipboard.copy(entry.path)
+            if success:
+                print(f"\n📋 Copied path: {entry.path}")
+            time.sleep(1)
+            self.invalidate_screen()
+        return True
+    
+    def copy_content(self) -> bool:
+        """Copy the current file's content to the clipboard."""
+        entry = self.current_entry()
+        if entry is not None:
+            content = get_file_content(Path(entry.path))
+            success = self.clipboard.copy(content)
+            if success:
+                print(f"\n📋 Copied content from: {entry.path}")
+            else:
+                print(f"\n⚠️ Could not copy content from: {entry.path}")
+            time.sleep(1)
+            self.invalidate_screen()
+        return True
+    
+    def toggle_fancy(self) -> bool:
+        """Toggle fancy mode if available."""
+        if self.mode.toggle_fancy():
+            # An empty query lists every file in either mode
+            self._query_dirty = self._query_dirty or bool(self.query)
+            self._display_dirty = True
+        return True
+    
+    def toggle_preview(self) -> bool:
+        """Toggle the preview pane."""
+        self.mode.show_preview = not self.mode.show_preview
+        self._display_dirty = True
+        return True
+    
+    def open_help(self) -> bool:
+        """Show the help overlay until a key is pressed."""
+        self.show_help()
+        self.invalidate_screen()
+        return True
+    
+    def quit(self) -> bool:
+        return False
+    
+    def escape(self) -> bool:
+        """Clear search or quit."""
+        if self.query:
+            self.set_query("")
             self.selected_index = 0
             return True
-        elif key == '\x05':  # Bottom (Ctrl+E for "End")
-            self.selected_index = len(self.filtered_files) - 1
-            return True
-        elif key == '\x1b[5~':  # Page Up
-            self.selected_index = max(0, self.selected_index - 10)
-            return True
-        elif key == '\x1b[6~':  # Page Down
-            self.selected_index = min(len(self.filtered_files) - 1, self.selected_index + 10)
-            return True
         return False
     
+    def clear_query(self) -> bool:
+        """Clear search."""
+        if self.query:
+            self.set_query("")
+            self.selected_index = 0
+        return True
     
-    def handle_action(self, key: str) -> bool:
-        """Handle action keys. Return True if should continue running."""
-        if key == '\r' or key == '\n':  # Enter - select file
-            if self.filtered_files and 0 <= self.selected_index < len(self.filtered_files):
-                self.selected_file = self.filtered_files[self.selected_index][0]
-        elif key == '\x03':  # Copy path (Ctrl+C)
-            if self.filtered_files and 0 <= self.selected_index < len(self.filtered_files):
-                file_path = self.filtered_files[self.selected_index][0]
-                success = self.clipboard.copy(str(file_path))
-                if success:
-                    print(f"\n📋 Copied path: {file_path}")
-                time.sleep(1)
-        elif key == '\x19':  # Copy content (Ctrl+Y)
-            if self.filtered_files and 0 <= self.selected_index < len(self.filtered_files):
-                file_path = self.filtered_files[self.selected_index][0]
-                content = get_file_content(file_path)
-                success = self.clipboard.copy(content)
-                if success:
-                    print(f"\n📋 Copied content from: {file_path}")
-                else:
-                    print(f"\n⚠️ Could not copy content from: {file_path}")
-                time.sleep(1)
-        elif key == '\x06':  # Toggle fancy mode (Ctrl+F)
-            if self.mode.toggle_fancy():
-                self.filtered_files = self.search()
-                # Fix index after search
-                if self.filtered_files:
-                    self.selected_index = min(self.selected_index, len(self.filtered_files) - 1)
-                else:
-                    self.selected_index = -1
-        elif key == '\x10':  # Toggle preview (Ctrl+P)
-            self.mode.show_preview = not self.mode.show_preview
-        elif key == '\x08':  # Help (Ctrl+H)
-            self.show_help()
-        elif key == '\x11':  # Quit (Ctrl+Q)
-            return False
-        elif key == '\x1b':  # Escape
-            if self.query:
-                self.query = ""
-                self.filtered_files = self.search()
-                self.selected_index = 0 if self.filtered_files else -1
-            else:
-                return False
-        elif key == '\x15':  # Ctrl+U - clear search
-            self.query = ""
-            self.filtered_files = self.search()
-            self.selected_index = 0 if self.filtered_files else -1
-        elif key == '\x7f' or key == '\b':  # Backspace
-            if self.query:
-                self.query = self.query[:-1]
-                self.filtered_files = self.search()
-                # Fix index after search
-                if self.filtered_files:
-                    self.selected_index = min(self.selected_index, len(self.filtered_files) - 1)
-                else:
-                    self.selected_index = -1
-        elif key.isprintable() and len(key) == 1:  # Regular character
-            self.query += key
-            self.filtered_files = self.search()
-            self.selected_index = 0 if self.filtered_files else -1
-    
+    def backspace(self) -> bool:
+        """Remove the last query character."""
+        if self.query:
+            self.set_query(self.query[:-1])
         return True
-
+    
+    def set_query(self, query: str):
+        """Change the query, flagging a search and a redraw."""
+        self.query = query
+        self._query_dirty = True
+        self._display_dirty = True
+    
     def run(self):
         """Main application loop."""
         while True:
-            # Update scroll offset to keep selected item visible
-            # Only do this if we have files and a valid selection
-            if self.filtered_files and 0 <= self.selected_index < len(self.filtered_files):
-                terminal_height = 20
-                start, end = self.get_display_range(terminal_height)
-                
-                if self.selected_index < start:
-                    self.scroll_offset = self.selected_index
-                elif self.selected_index >= end:
-                    available_height = terminal_height - 6
-                    if self.mode.show_preview and self.selected_file:
-                        available_height -= 6
-                    self.scroll_offset = self.selected_index - available_height + 1
-            else:
-                # Reset scroll when no valid selection
-                self.scroll_offset = 0
-            
-            self.draw_ui()
+            # Search and redraw only when something actually changed
+            if self._query_dirty:
+                self._query_dirty = False
+                self.request_search()
             
-            if not self.filtered_files:
-                print(colored("\n🔍 No files found. Try a different search term.", Colors.YELLOW))
+            if self._display_dirty:
+                self._display_dirty = False
+                
+                # Update scroll offset to keep selected item visible
+                # Only do this if we have files and a valid selection
+                if self.filtered_files and 0 <= self.selected_index < len(self.filtered_files):
+                    start, end = self.get_display_range()
+                    
+                    if self.selected_index < start:
+                        self.scroll_offset = self.selected_index
+                    elif self.selected_index >= end:
+                        self.scroll_offset = self.selected_index - self.get_visible_count() + 1
+                else:
+                    # Reset scroll when no valid selection
+                    self.scroll_offset = 0
+                
+                self.draw_ui()
             
             try:
-                key = self.get_input()
-                
-                # Handle navigation
-                if self.handle_navigation(key):
-                    continue
+                keys = self.wait_for_input()
+                if keys is None:
+                    continue  # Search results arrived
                 
-                # Handle actions
-                if not self.handle_action(key):
+                # Apply every buffered key before searching or redrawing once
+                if not all(self.handle_key(key) for key in split_keys(keys)):
                     break
                     
             except KeyboardInterrupt: